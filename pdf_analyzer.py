@@ -9,6 +9,11 @@ class BankStatementAnalyzer:
     def __init__(self):
         self.statements_dir = "statements"
         self.analysis_results = {}
+        # Quick check for amount-like tokens, used to skip table extraction
+        # on pages that clearly contain no tabular data
+        self._amount_re = re.compile(r'\$?\d[\d,]*\.\d{2}')
+        # Counts all transaction keywords in a header in one scan
+        self._txn_keyword_re = re.compile(r'\b(?:date|transaction|description|amount|debit|credit|balance)\b')
     
     def analyze_all_statements(self):
         """Analyze all PDF statements to understand their structure"""
@@ -49,8 +54,19 @@ class BankStatementAnalyzer:
                 # Extract text
                 text = page.extract_text()
                 if text:
-                    # Find tables
-                    tables = page.extract_tables()
+                    # Find tables - but only on pages that look tabular;
+                    # table extraction is by far the slowest step per page
+                    looks_tabular = self._amount_re.search(text) and text.count('\n') > 10
+                    tables = []
+                    if looks_tabular:
+                        # Text-based strategies are faster; fall back to the
+                        # default (lines-based) detection if they find nothing
+                        tables = page.extract_tables({
+                            'vertical_strategy': 'text',
+                            'horizontal_strategy': 'text'
+                        })
+                        if not tables:
+                            tables = page.extract_tables()
                     if tables:
                         for table_idx, table in enumerate(tables):
                             table_analysis = self.analyze_table(table, page_num, table_idx)
@@ -94,6 +110,7 @@ class BankStatementAnalyzer:
             'rows': len(cleaned_table),
             'columns': len(cleaned_table[0]) if cleaned_table else 0,
             'headers': cleaned_table[0] if cleaned_table else [],
+            'headers_lower': tuple(h.lower() for h in cleaned_table[0] if h) if cleaned_table else (),
             'sample_rows': cleaned_table[1:4] if len(cleaned_table) > 1 else [],
             'column_types': [],
             'has_dates': False,
@@ -119,12 +136,10 @@ class BankStatementAnalyzer:
                     analysis['has_descriptions'] = True
                     analysis['transaction_score'] += 2
         
-        # Check headers for transaction indicators
+        # Check headers for transaction indicators - one regex scan instead
+        # of a substring search per keyword
         header_text = ' '.join(analysis['headers']).lower()
-        transaction_keywords = ['date', 'transaction', 'description', 'amount', 'debit', 'credit', 'balance']
-        for keyword in transaction_keywords:
-            if keyword in header_text:
-                analysis['transaction_score'] += 1
+        analysis['transaction_score'] += len(set(self._txn_keyword_re.findall(header_text)))
         
         return analysis
     
@@ -288,23 +303,23 @@ class BankStatementAnalyzer:
             transaction_count = len(analysis['potential_transaction_tables'])
             print(f"  • {bank_name}: {transaction_count} transaction table(s)")
         
-        # Analyze common patterns
-        all_column_types = []
-        all_headers = []
-        
+        # Analyze common patterns - stream straight into Counters instead of
+        # building intermediate lists; headers were already lowercased once
+        # at analysis time
+        from collections import Counter
+        type_counts = Counter()
+        header_counts = Counter()
+
         for analysis in self.analysis_results.values():
             for table in analysis['potential_transaction_tables']:
-                all_column_types.extend(table['column_types'])
-                all_headers.extend([h.lower() for h in table['headers'] if h])
-        
+                type_counts.update(table['column_types'])
+                header_counts.update(table['headers_lower'])
+
         print(f"\n📊 Common Column Types:")
-        from collections import Counter
-        type_counts = Counter(all_column_types)
         for col_type, count in type_counts.most_common():
             print(f"  • {col_type}: {count} occurrences")
-        
+
         print(f"\n📋 Common Headers:")
-        header_counts = Counter(all_headers)
         for header, count in header_counts.most_common(10):
             print(f"  • '{header}': {count} occurrences")
 
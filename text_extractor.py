@@ -1,3 +1,5 @@
+import bisect
+import concurrent.futures
 import logging
 import pdfplumber
 import pandas as pd
@@ -10,39 +12,155 @@ import random
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# google-re2 guarantees linear-time matching and is markedly faster than the
+# stdlib backtracker on backreference-free patterns like the fused date and
+# amount alternations below. Optional - fall back to the stdlib when not
+# installed.
+try:
+    import re2 as _re
+except ImportError:
+    _re = re
+
+# PyMuPDF extracts plain text several times faster than pdfplumber's
+# pdfminer-based interpreter, and plain text is all this extractor needs.
+# Optional - fall back to pdfplumber when not installed.
+try:
+    import fitz
+except ImportError:
+    fitz = None
+
+# Below this page count the pool's process-spawn overhead outweighs the win
+_PARALLEL_PAGE_THRESHOLD = 8
+
+_DATE_PATTERNS = [
+    r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}',
+    r'\d{4}[/-]\d{1,2}[/-]\d{1,2}',
+    r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\.?\s*\d{1,2},?\s*\d{4}',
+    r'\d{1,2}\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)',
+    r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\.\d{1,2},\d{4}',  # BMO format: Dec.5,2021
+    r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\.\d{1,2}\b',  # BMO transaction format: Nov.9
+]
+
+_AMOUNT_PATTERNS = [
+    r'\$\d{1,3}(?:,\d{3})*\.\d{2}',
+    r'\$\d+\.\d{2}',
+    r'\(\$\d+\.\d{2}\)',
+    r'\+\$?\d{1,3}(?:,\d{3})*\.\d{2}',  # Positive amounts with +
+    r'-\$?\d{1,3}(?:,\d{3})*\.\d{2}',  # Negative amounts with -
+    r'\b\d{1,3}(?:,\d{3})*\.\d{2}\b',  # Plain decimal amounts (BMO format)
+    r'\b\d+\.\d{2}\b',  # Simple decimal amounts
+]
+
+# Keywords that indicate non-transaction content
+_EXCLUSION_KEYWORDS = [
+    'opening balance', 'closing balance', 'total', 'subtotal',
+    'previous statement', 'terms and conditions', 'privacy policy',
+    'prior to april', 'member of', 'deposit insurance'
+]
+
+# Everything below compiles once, at import time. The hot loops run
+# these against every line of every page, and the extractor is also
+# constructed once per pool worker - instances share the Pattern
+# objects instead of each paying the compile cost.
+_DATE_RES = [re.compile(p, re.IGNORECASE) for p in _DATE_PATTERNS]
+_AMOUNT_RES = [re.compile(p) for p in _AMOUNT_PATTERNS]
+# Fused alternations for the yes/no checks: one engine pass over the
+# line instead of one per pattern. The per-pattern lists stay for
+# extraction, where list order (not leftmost position) decides which
+# pattern wins. These two run on every line of every page, so they go
+# through re2 when it is installed
+# The fused date form swaps \s for [^\S\n]: the detection pre-pass runs
+# it page-wide, and the per-line scans it replaces could never match
+# across a newline (e.g. one line's trailing '...424.62' plus the next
+# line's 'JAN 7' must not read as a date)
+_DATE_ANY = _re.compile(
+    '|'.join(f'(?:{p})' for p in _DATE_PATTERNS).replace(r'\s', r'[^\S\n]'),
+    _re.IGNORECASE)
+_AMOUNT_ANY = _re.compile('|'.join(f'(?:{p})' for p in _AMOUNT_PATTERNS))
+_DIGIT_RUN_RE = re.compile(r'\d+')
+_NON_NUMERIC_RE = re.compile(r'[^\d.]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Keyword sets as escaped alternations (the stdlib stand-in for an
+# Aho-Corasick automaton): one IGNORECASE pass over the raw line
+# replaces a lowercase copy plus one substring scan per keyword.
+# Deliberately not frozenset-vs-token intersections: the original
+# checks used substring containment, so 'dates' must still count
+# as 'date', which tokenized exact matching would drop
+_EXCLUSION_RE = re.compile(
+    '|'.join(map(re.escape, _EXCLUSION_KEYWORDS)), re.IGNORECASE)
+_TXN_KEYWORD_RE = re.compile(
+    'date|transaction|description|amount|debit|credit', re.IGNORECASE)
+_HEADER_KW_RE = re.compile(
+    'date|transaction|description|amount|debit|credit|balance',
+    re.IGNORECASE)
+_SUMMARY_RE = re.compile(
+    'total|subtotal|balance|opening|closing|previous|carried forward',
+    re.IGNORECASE)
+_MULTILINE_SKIP_RE = re.compile(
+    'transaction date|account balance|interest rate|opening balance',
+    re.IGNORECASE)
+_MULTILINE_REJECT_RE = re.compile(
+    'transaction date|balance|account', re.IGNORECASE)
+
+# Preprocess substitutions, compiled once and fused where the rules
+# allow: the three sign/dollar markers share one alternation (a bare
+# digit after a letter is not a marker - the sign or dollar must be
+# there), and the keyword padding runs as two alternation passes
+# instead of two passes per keyword. Replacements keep the keywords'
+# canonical casing, as the per-keyword substitutions did.
+_PP_KEYWORDS = ['PreviousBalance', 'NewBalance', 'PaymentDue',
+                'CreditLimit', 'MinimumPayment']
+_PP_CANONICAL = {k.lower(): k for k in _PP_KEYWORDS}
+_PP_KW_ALT = '|'.join(_PP_KEYWORDS)
+_PP_SUBS = [
+    # Add space before dates
+    (re.compile(r'([a-zA-Z])(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})'), r'\1 \2'),
+    (re.compile(r'([a-zA-Z])(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)',
+                re.IGNORECASE), r'\1 \2'),
+    # Add space before dollar amounts
+    (re.compile(r'([a-zA-Z])((?:[+-]\$?|\$)\d)'), r'\1 \2'),
+    # Add space after commas in dates
+    (re.compile(r'(\d),(\d{4})'), r'\1, \2'),
+    # Add space around transaction keywords
+    (re.compile(r'(?<=[a-zA-Z])(?:%s)' % _PP_KW_ALT, re.IGNORECASE),
+     lambda m: ' ' + _PP_CANONICAL[m.group(0).lower()]),
+    (re.compile(r'(?:%s)(?=[a-zA-Z])' % _PP_KW_ALT, re.IGNORECASE),
+     lambda m: _PP_CANONICAL[m.group(0).lower()] + ' '),
+]
+
+
 class TextBasedExtractor:
     """
     Intelligent text-based transaction extractor using table detection
     and pattern recognition for text-based PDFs
     """
-    
+
+    # Class-level aliases to the module constants above, keeping the
+    # established self._xxx spelling without per-instance compile work
+    _date_res = _DATE_RES
+    _amount_res = _AMOUNT_RES
+    _date_any = _DATE_ANY
+    _amount_any = _AMOUNT_ANY
+    _digit_run_re = _DIGIT_RUN_RE
+    _non_numeric_re = _NON_NUMERIC_RE
+    _whitespace_re = _WHITESPACE_RE
+    _exclusion_re = _EXCLUSION_RE
+    _txn_keyword_re = _TXN_KEYWORD_RE
+    _header_kw_re = _HEADER_KW_RE
+    _summary_re = _SUMMARY_RE
+    _multiline_skip_re = _MULTILINE_SKIP_RE
+    _multiline_reject_re = _MULTILINE_REJECT_RE
+    _pp_subs = _PP_SUBS
+
     def __init__(self):
-        self.date_patterns = [
-            r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}',
-            r'\d{4}[/-]\d{1,2}[/-]\d{1,2}',
-            r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\.?\s*\d{1,2},?\s*\d{4}',
-            r'\d{1,2}\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)',
-            r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\.\d{1,2},\d{4}',  # BMO format: Dec.5,2021
-            r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\.\d{1,2}\b',  # BMO transaction format: Nov.9
-        ]
-        
-        self.amount_patterns = [
-            r'\$\d{1,3}(?:,\d{3})*\.\d{2}',
-            r'\$\d+\.\d{2}',
-            r'\(\$\d+\.\d{2}\)',
-            r'\+\$?\d{1,3}(?:,\d{3})*\.\d{2}',  # Positive amounts with +
-            r'-\$?\d{1,3}(?:,\d{3})*\.\d{2}',  # Negative amounts with -
-            r'\b\d{1,3}(?:,\d{3})*\.\d{2}\b',  # Plain decimal amounts (BMO format)
-            r'\b\d+\.\d{2}\b',  # Simple decimal amounts
-        ]
-        
-        # Keywords that indicate non-transaction content
-        self.exclusion_keywords = [
-            'opening balance', 'closing balance', 'total', 'subtotal',
-            'previous statement', 'terms and conditions', 'privacy policy',
-            'prior to april', 'member of', 'deposit insurance'
-        ]
-    
+        # The raw pattern lists stay per-instance attributes for callers
+        # that introspect or tweak them; copies, so one instance's edits
+        # don't bleed into another's
+        self.date_patterns = list(_DATE_PATTERNS)
+        self.amount_patterns = list(_AMOUNT_PATTERNS)
+        self.exclusion_keywords = list(_EXCLUSION_KEYWORDS)
+
     def extract_transactions(self, pdf_path: str) -> List[Dict[str, Any]]:
         """
         Extract transactions from text-based PDF
@@ -52,19 +170,54 @@ class TextBasedExtractor:
         all_transactions = []
         
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                for page_num, page in enumerate(pdf.pages, 1):
-                    text = page.extract_text()
-                    if text:
-                        page_transactions = self.extract_transactions_from_text(text, page_num)
+            page_texts = ((page_num, text)
+                          for page_num, text in enumerate(self._page_texts(pdf_path), 1)
+                          if text)
+
+            # Pattern matching is CPU-bound Python and pages are
+            # independent, so large statements fan the per-page parsing
+            # out to worker processes; small ones stay sequential. The
+            # generator is fed to the pool unmaterialized: the pool's
+            # submission loop drains it on the main thread while the
+            # workers already parse earlier pages, so page I/O overlaps
+            # parsing instead of completing before it starts
+            if self._page_count(pdf_path) < _PARALLEL_PAGE_THRESHOLD:
+                for page_num, text in page_texts:
+                    all_transactions.extend(
+                        self.extract_transactions_from_text(text, page_num))
+            else:
+                with concurrent.futures.ProcessPoolExecutor() as pool:
+                    for page_transactions in pool.map(
+                            _extract_page_worker, page_texts, chunksize=4):
                         all_transactions.extend(page_transactions)
-            
+
             logger.info(f"✅ Found {len(all_transactions)} transactions")
             return all_transactions
-            
+
         except Exception as e:
             logger.error(f"❌ Failed: {e}")
             return []
+
+    def _page_count(self, pdf_path: str) -> int:
+        """Number of pages, read from the document header without
+        extracting any text"""
+        if fitz is not None:
+            with fitz.open(pdf_path) as doc:
+                return doc.page_count
+        with pdfplumber.open(pdf_path) as pdf:
+            return len(pdf.pages)
+
+    def _page_texts(self, pdf_path: str):
+        """Yield each page's text, using PyMuPDF's C extractor when it is
+        installed and pdfplumber otherwise"""
+        if fitz is not None:
+            with fitz.open(pdf_path) as doc:
+                for page in doc:
+                    yield page.get_text("text")
+        else:
+            with pdfplumber.open(pdf_path) as pdf:
+                for page in pdf.pages:
+                    yield page.extract_text()
     
     def extract_transactions_from_text(self, text: str, page_num: int) -> List[Dict[str, Any]]:
         """
@@ -74,108 +227,121 @@ class TextBasedExtractor:
         
         # Preprocess text to handle concatenated formats like BMO
         cleaned_text = self._preprocess_text(text)
-        
+
+        # Split and strip once; the table-region detector and the fallback
+        # pattern extractor both work line-by-line on the same page, so
+        # they share one stripped list instead of each building their own
+        lines = cleaned_text.split('\n')
+        stripped = [line.strip() for line in lines]
+
         # Step 1: Detect tabular structures
-        table_regions = self._detect_table_regions(cleaned_text)
-        
+        table_regions = self._detect_table_regions(cleaned_text, lines, stripped)
+
         # Step 2: Score and filter transaction tables
         transaction_tables = self._identify_transaction_tables(table_regions)
-        
+
         # Step 3: Extract transactions from identified tables
         for table in transaction_tables:
             table_transactions = self._extract_from_table_region(table, page_num)
             transactions.extend(table_transactions)
-        
+
         # Step 4: Fallback - look for transaction patterns in remaining text
         if not transactions:
-            fallback_transactions = self._extract_transaction_patterns(cleaned_text, page_num)
+            fallback_transactions = self._extract_transaction_patterns(stripped, page_num)
             transactions.extend(fallback_transactions)
         
         return transactions
     
     def _preprocess_text(self, text: str) -> str:
         """Preprocess text to handle concatenated formats and improve parsing"""
-        # Add spaces around common patterns to separate concatenated text
-        
-        # Add space before dates
-        text = re.sub(r'([a-zA-Z])(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})', r'\1 \2', text)
-        text = re.sub(r'([a-zA-Z])(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)', r'\1 \2', text, flags=re.IGNORECASE)
-        
-        # Add space before dollar amounts
-        text = re.sub(r'([a-zA-Z])(\$\d)', r'\1 \2', text)
-        text = re.sub(r'([a-zA-Z])(\+\$?\d)', r'\1 \2', text)
-        text = re.sub(r'([a-zA-Z])(-\$?\d)', r'\1 \2', text)
-        
-        # Add space after commas in dates
-        text = re.sub(r'(\d),(\d{4})', r'\1, \2', text)
-        
-        # Add space around transaction keywords
-        keywords = ['PreviousBalance', 'NewBalance', 'PaymentDue', 'CreditLimit', 'MinimumPayment']
-        for keyword in keywords:
-            text = re.sub(f'([a-zA-Z]){keyword}', f'\\1 {keyword}', text, flags=re.IGNORECASE)
-            text = re.sub(f'{keyword}([a-zA-Z])', f'{keyword} \\1', text, flags=re.IGNORECASE)
-        
+        # Add spaces around common patterns to separate concatenated text -
+        # the substitutions are compiled and fused in __init__, so this is
+        # six full-text passes instead of sixteen
+        for pattern, repl in self._pp_subs:
+            text = pattern.sub(repl, text)
         return text
     
-    def _detect_table_regions(self, text: str) -> List[Dict[str, Any]]:
+    def _detect_table_regions(self, text: str, lines: List[str],
+                              stripped: List[str]) -> List[Dict[str, Any]]:
         """
-        Detect potential table regions in text
+        Detect potential table regions in text. Takes the page's raw and
+        stripped line lists from the caller - the raw ones anchor the
+        offset math below, the stripped ones populate the regions
         """
-        lines = text.split('\n')
+        # Pre-pass: compute the per-line facts with three scans over the
+        # whole page instead of three per line. Each fused pattern runs
+        # once via finditer and the match offsets are bucketed back to
+        # line indices through the cumulative line-start offsets. The
+        # region loop and the scoring below then work on plain booleans
+        # and ints instead of re-running the regexes per check
+        n = len(lines)
+        line_starts = [0] * n
+        pos = 0
+        for i, line in enumerate(lines):
+            line_starts[i] = pos
+            pos += len(line) + 1
+
+        has_date = [False] * n
+        has_amount = [False] * n
+        digit_count = [0] * n
+        line_at = bisect.bisect_right
+        for match in self._date_any.finditer(text):
+            has_date[line_at(line_starts, match.start()) - 1] = True
+        for match in self._amount_any.finditer(text):
+            has_amount[line_at(line_starts, match.start()) - 1] = True
+        for match in self._digit_run_re.finditer(text):
+            digit_count[line_at(line_starts, match.start()) - 1] += 1
+
         table_regions = []
         current_region = []
-        
-        for i, line in enumerate(lines):
-            line = line.strip()
+
+        def save_region(end):
+            start = end - len(current_region)
+            table_regions.append({
+                'lines': current_region,
+                'start_line': start,
+                'end_line': end,
+                'text': '\n'.join(current_region),
+                # Flag slices travel with the region so scoring can sum
+                # them instead of rescanning every line
+                'has_date': has_date[start:end],
+                'has_amount': has_amount[start:end],
+            })
+
+        for i, line in enumerate(stripped):
             if not line:
                 if current_region:
                     # End of potential table region
-                    table_regions.append({
-                        'lines': current_region,
-                        'start_line': i - len(current_region),
-                        'end_line': i,
-                        'text': '\n'.join(current_region)
-                    })
+                    save_region(i)
                     current_region = []
                 continue
-            
+
             # Check if line looks like table data
-            if self._is_table_like_line(line):
+            if self._is_table_like_line(has_date[i], has_amount[i], digit_count[i]):
                 current_region.append(line)
             else:
                 if current_region and len(current_region) >= 2:
                     # Save accumulated region
-                    table_regions.append({
-                        'lines': current_region,
-                        'start_line': i - len(current_region),
-                        'end_line': i,
-                        'text': '\n'.join(current_region)
-                    })
+                    save_region(i)
                 current_region = []
-        
+
         # Handle last region
         if current_region and len(current_region) >= 2:
-            table_regions.append({
-                'lines': current_region,
-                'start_line': len(lines) - len(current_region),
-                'end_line': len(lines),
-                'text': '\n'.join(current_region)
-            })
-        
+            save_region(len(lines))
+
         return table_regions
-    
-    def _is_table_like_line(self, line: str) -> bool:
+
+    def _is_table_like_line(self, has_date: bool, has_amount: bool,
+                            digit_count: int) -> bool:
         """
-        Check if a line looks like it could be part of a table
+        Check if a line looks like it could be part of a table, given the
+        line's precomputed facts from the detection pre-pass. Already
+        regex-free, so a cheap digit-count gate in front of it would only
+        add a branch
         """
-        # Must have both date and amount patterns
-        has_date = any(re.search(pattern, line, re.IGNORECASE) for pattern in self.date_patterns)
-        has_amount = any(re.search(pattern, line) for pattern in self.amount_patterns)
-        
-        # Or have multiple numeric/structured elements
-        numeric_elements = len(re.findall(r'\d+', line))
-        
-        return (has_date and has_amount) or numeric_elements >= 3
+        # Must have both date and amount patterns, or have multiple
+        # numeric/structured elements
+        return (has_date and has_amount) or digit_count >= 3
     
     def _identify_transaction_tables(self, table_regions: List[Dict]) -> List[Dict]:
         """
@@ -197,27 +363,25 @@ class TextBasedExtractor:
         Score a table region for likelihood of containing transactions
         """
         score = 0
-        text = region['text'].lower()
+        text = region['text']
         lines = region['lines']
-        
-        # Check for transaction indicators
-        transaction_keywords = ['date', 'transaction', 'description', 'amount', 'debit', 'credit']
-        for keyword in transaction_keywords:
-            if keyword in text:
-                score += 2
-        
-        # Check for date patterns
-        date_count = sum(1 for line in lines if any(re.search(p, line, re.IGNORECASE) for p in self.date_patterns))
-        score += min(date_count, 5)  # Max 5 points for dates
-        
-        # Check for amount patterns
-        amount_count = sum(1 for line in lines if any(re.search(p, line) for p in self.amount_patterns))
-        score += min(amount_count, 5)  # Max 5 points for amounts
-        
-        # Penalty for exclusion keywords
-        for keyword in self.exclusion_keywords:
-            if keyword in text:
-                score -= 3
+
+        # Check for transaction indicators - one scan counts every distinct
+        # keyword that appears
+        score += 2 * len(set(m.lower() for m in self._txn_keyword_re.findall(text)))
+
+        # Date and amount coverage, summed from the flags precomputed in
+        # the detection pre-pass - no regex work here
+        score += min(sum(region['has_date']), 5)  # Max 5 points for dates
+        score += min(sum(region['has_amount']), 5)  # Max 5 points for amounts
+        
+        # Penalty for exclusion keywords - distinct hits, like the old
+        # per-keyword scans. 'subtotal' implies 'total' under substring
+        # semantics, so it keeps its double penalty
+        excluded = set(m.lower() for m in self._exclusion_re.findall(text))
+        if 'subtotal' in excluded:
+            excluded.add('total')
+        score -= 3 * len(excluded)
         
         # Bonus for consistent structure
         if len(lines) >= 3:
@@ -250,40 +414,45 @@ class TextBasedExtractor:
     
     def _is_header_line(self, line: str) -> bool:
         """Check if line is a table header"""
-        line_lower = line.lower()
-        header_indicators = ['date', 'transaction', 'description', 'amount', 'debit', 'credit', 'balance']
-        
-        # If line contains multiple header keywords but no actual data
-        header_count = sum(1 for keyword in header_indicators if keyword in line_lower)
-        has_date = any(re.search(pattern, line, re.IGNORECASE) for pattern in self.date_patterns)
-        has_amount = any(re.search(pattern, line) for pattern in self.amount_patterns)
+        # If line contains multiple header keywords but no actual data -
+        # one scan counts the distinct keywords present
+        header_count = len(set(m.lower() for m in self._header_kw_re.findall(line)))
+        has_date = self._date_any.search(line) is not None
+        has_amount = self._amount_any.search(line) is not None
         
         return header_count >= 2 and not (has_date and has_amount)
     
     def _is_summary_line(self, line: str) -> bool:
-        """Check if line is a summary/total line"""
-        line_lower = line.lower()
-        summary_keywords = ['total', 'subtotal', 'balance', 'opening', 'closing', 'previous', 'carried forward']
-        
-        return any(keyword in line_lower for keyword in summary_keywords)
+        """Check if line is a summary/total line.
+
+        Takes the raw line: the compiled patterns here and in
+        _is_header_line carry IGNORECASE, so callers never need to build
+        a lowercased copy
+        """
+        return self._summary_re.search(line) is not None
     
     def _parse_transaction_line(self, line: str, page_num: int) -> Dict[str, Any]:
         """
         Parse a single transaction line
         """
-        # Extract date
-        date = self._extract_date(line)
+        # Extract date, keeping its span so the description step can
+        # carve it out without re-scanning
+        date, date_span = self._find_date(line)
         if not date:
             return None
-        
+
         # Extract amount
         amount = self._extract_amount(line)
         if amount is None:
             return None
-        
-        # Extract description (everything else)
-        description = self._extract_description(line, date, amount)
-        
+
+        return self._build_transaction(line, date, date_span, amount, page_num)
+
+    def _build_transaction(self, line: str, date: str, date_span: Tuple[int, int],
+                           amount: float, page_num: int) -> Dict[str, Any]:
+        """Assemble a transaction record from an already-parsed line"""
+        description = self._extract_description(line, date_span)
+
         return {
             'date': date,
             'description': description,
@@ -293,26 +462,40 @@ class TextBasedExtractor:
             'extraction_method': 'text_pattern'
         }
     
+    def _find_date(self, line: str) -> Tuple[str, Tuple[int, int]]:
+        """Extract date from line as (text, span), by pattern priority"""
+        for pattern in self._date_res:
+            match = pattern.search(line)
+            if match:
+                return match.group(), match.span()
+        return None, None
+
     def _extract_date(self, line: str) -> str:
         """Extract date from line"""
-        for pattern in self.date_patterns:
-            match = re.search(pattern, line, re.IGNORECASE)
-            if match:
-                return match.group()
-        return None
+        return self._find_date(line)[0]
     
     def _extract_amount(self, line: str) -> float:
-        """Extract amount from line"""
-        for pattern in self.amount_patterns:
-            match = re.search(pattern, line)
+        """Extract amount from line.
+
+        The cascade stays per-pattern: list order ranks the candidates
+        ('$45.99' beats a bare '4.55' anywhere in the line), which a
+        single leftmost-match union cannot express without changing
+        which token wins and how its sign reads. The fused alternation
+        only fronts it as a quick reject, so amount-free lines cost one
+        scan instead of seven
+        """
+        if self._amount_any.search(line) is None:
+            return None
+        for pattern in self._amount_res:
+            match = pattern.search(line)
             if match:
                 amount_str = match.group()
                 # Check for negative indicators
                 is_negative = '(' in amount_str or amount_str.startswith('-')
                 is_positive = amount_str.startswith('+')
-                
+
                 # Clean and convert to float
-                amount_str = re.sub(r'[^\d.]', '', amount_str)
+                amount_str = self._non_numeric_re.sub('', amount_str)
                 try:
                     amount = float(amount_str)
                     # Handle negative amounts
@@ -323,18 +506,20 @@ class TextBasedExtractor:
                     continue
         return None
     
-    def _extract_description(self, line: str, date: str, amount: float) -> str:
-        """Extract description by removing date and amount"""
-        description = line
-        
-        # Remove date
-        if date:
-            description = description.replace(date, '')
-        
-        # Remove amount patterns
-        for pattern in self.amount_patterns:
-            description = re.sub(pattern, '', description)
-        
+    def _extract_description(self, line: str, date_span: Tuple[int, int]) -> str:
+        """Extract description by removing date and amounts"""
+        # Carve the date out by its span - no scan needed, the parse
+        # already located it
+        if date_span:
+            start, end = date_span
+            description = line[:start] + line[end:]
+        else:
+            description = line
+
+        # Remove amount tokens (all of them, so trailing balance columns
+        # don't leak into the description) in one fused pass
+        description = self._amount_any.sub('', description)
+
         # Clean up
         description = ' '.join(description.split()).strip()
         
@@ -344,119 +529,124 @@ class TextBasedExtractor:
         
         return description
     
-    def _extract_transaction_patterns(self, text: str, page_num: int) -> List[Dict[str, Any]]:
+    def _extract_transaction_patterns(self, lines: List[str], page_num: int) -> List[Dict[str, Any]]:
         """
-        Fallback method to extract transactions using pattern matching
+        Fallback method to extract transactions using pattern matching.
+        Takes the page's already-stripped lines
         """
         transactions = []
-        lines = text.split('\n')
-        
+
+        # Parse each line once up front; both passes below read from this
+        # instead of re-running the date cascade and amount cascade on
+        # lines the other pass already scanned
+        line_info = [self._find_date(line) + (self._extract_amount(line),)
+                     if line else (None, None, None)
+                     for line in lines]
+
         # First pass: Look for lines with both date and amount (single-line transactions)
-        for line in lines:
-            line = line.strip()
+        for i, line in enumerate(lines):
             if not line:
                 continue
-            
+
             # Skip obvious non-transaction lines
-            if any(keyword in line.lower() for keyword in self.exclusion_keywords):
+            if self._exclusion_re.search(line):
                 continue
-            
+
             # Look for lines with both date and amount
-            has_date = any(re.search(pattern, line, re.IGNORECASE) for pattern in self.date_patterns)
-            has_amount = any(re.search(pattern, line) for pattern in self.amount_patterns)
-            
-            if has_date and has_amount:
-                transaction = self._parse_transaction_line(line, page_num)
-                if transaction:
-                    transaction['confidence'] = 0.7  # Lower confidence for fallback
-                    transactions.append(transaction)
-        
+            date, date_span, amount = line_info[i]
+            if date and amount is not None:
+                transaction = self._build_transaction(line, date, date_span,
+                                                      amount, page_num)
+                transaction['confidence'] = 0.7  # Lower confidence for fallback
+                transactions.append(transaction)
+
         # Second pass: Look for multi-line transactions (Tangerine format)
         if len(transactions) < 5:  # Only if we didn't find many transactions
-            transactions.extend(self._extract_multiline_transactions(lines, page_num))
-        
+            transactions.extend(
+                self._extract_multiline_transactions(lines, line_info, page_num))
+
         return transactions
     
-    def _extract_multiline_transactions(self, lines: List[str], page_num: int) -> List[Dict[str, Any]]:
+    def _extract_multiline_transactions(self, lines: List[str], line_info: List[Tuple],
+                                        page_num: int) -> List[Dict[str, Any]]:
         """
-        Extract transactions that span multiple lines (like Tangerine format)
+        Extract transactions that span multiple lines (like Tangerine
+        format). Takes the page's already-stripped lines and the caller's
+        per-line (date, date_span, amount) parses - the scanner reads a
+        line both as the current line and again as lookahead for the
+        previous transaction, so nothing here re-runs the pattern cascades
         """
         transactions = []
-        used_lines = set()  # Track which lines we've already processed
-        
+        # Bitmap of lines already consumed - indexed lookups, no hashing
+        used_lines = bytearray(len(lines))
+
         for i, line in enumerate(lines):
-            if i in used_lines:
+            if used_lines[i]:
                 continue
-                
-            line = line.strip()
+
             if not line:
                 continue
-            
+
             # Skip header lines and non-transaction content
-            if any(keyword in line.lower() for keyword in ['transaction date', 'account balance', 'interest rate', 'opening balance']):
+            if self._multiline_skip_re.search(line):
                 continue
-            
+
             # Look for date patterns
-            date_match = None
-            for pattern in self.date_patterns:
-                match = re.search(pattern, line, re.IGNORECASE)
-                if match:
-                    date_match = match.group()
-                    break
-            
+            date_match = line_info[i][0]
+
             if date_match:
                 # Found a date, now look for amount in current line or next few lines
                 description_parts = []
                 amount = None
                 
                 # First check if amount is on the same line
-                current_amount = self._extract_amount(line)
+                current_amount = line_info[i][2]
                 if current_amount is not None:
                     amount = current_amount
                     # Extract description (remove date and amount)
                     current_desc = line
                     current_desc = current_desc.replace(date_match, '').strip()
-                    for pattern in self.amount_patterns:
-                        current_desc = re.sub(pattern, '', current_desc)
+                    for pattern in self._amount_res:
+                        current_desc = pattern.sub('', current_desc)
                     current_desc = current_desc.strip()
                     if current_desc:
                         description_parts.append(current_desc)
-                    used_lines.add(i)
+                    used_lines[i] = 1
                 else:
                     # Extract description from current line (remove date)
                     current_desc = line.replace(date_match, '').strip()
                     if current_desc:
                         description_parts.append(current_desc)
-                    used_lines.add(i)
+                    used_lines[i] = 1
                     
                     # Look in next 2 lines for amount and more description
                     for j in range(1, 3):
                         if i + j < len(lines):
-                            next_line = lines[i + j].strip()
+                            next_line = lines[i + j]
                             if not next_line:
                                 break
                             
                             # Check if this line has an amount
-                            line_amount = self._extract_amount(next_line)
+                            line_amount = line_info[i + j][2]
                             if line_amount is not None and amount is None:
                                 amount = line_amount
-                                used_lines.add(i + j)
+                                used_lines[i + j] = 1
                                 
                                 # Add any remaining text as description
                                 remaining_text = next_line
-                                for pattern in self.amount_patterns:
-                                    remaining_text = re.sub(pattern, '', remaining_text)
+                                for pattern in self._amount_res:
+                                    remaining_text = pattern.sub('', remaining_text)
                                 remaining_text = remaining_text.strip()
                                 if remaining_text and len(remaining_text) > 2:
                                     description_parts.append(remaining_text)
                                 break
                             else:
                                 # Add as description if it's substantial and not a header
-                                if (len(next_line) > 5 and 
-                                    not any(keyword in next_line.lower() for keyword in self.exclusion_keywords) and
-                                    not any(keyword in next_line.lower() for keyword in ['transaction date', 'balance', 'account'])):
+                                if (len(next_line) > 5 and
+                                    not self._exclusion_re.search(next_line) and
+                                    not self._multiline_reject_re.search(next_line)):
                                     description_parts.append(next_line)
-                                    used_lines.add(i + j)
+                                    used_lines[i + j] = 1
                 
                 # Create transaction if we found both date and amount
                 if amount is not None and amount > 0:  # Only positive amounts for now
@@ -465,7 +655,7 @@ class TextBasedExtractor:
                         description = "Transaction"
                     
                     # Clean up description
-                    description = re.sub(r'\s+', ' ', description)  # Normalize whitespace
+                    description = self._whitespace_re.sub(' ', description)  # Normalize whitespace
                     description = description[:100]  # Limit length
                     
                     transaction = {
@@ -481,6 +671,21 @@ class TextBasedExtractor:
         return transactions
 
 
+# One extractor per worker process, created lazily and reused across
+# every page the worker handles
+_worker_extractor = None
+
+
+def _extract_page_worker(args: Tuple[int, str]) -> List[Dict[str, Any]]:
+    """Parse one page's text in a worker process. Top-level so it can be
+    pickled to the pool."""
+    global _worker_extractor
+    if _worker_extractor is None:
+        _worker_extractor = TextBasedExtractor()
+    page_num, text = args
+    return _worker_extractor.extract_transactions_from_text(text, page_num)
+
+
 # Test the extractor
 if __name__ == "__main__":
     extractor = TextBasedExtractor()